@@ -46,11 +46,14 @@ class SpecGrid:
 
     """
 
-    def __init__(self, file_name):
+    def __init__(self, file_name, mmap=False):
         """SpecGrid constructor (via loading data from a `specgrid` file).
 
         Args:
             file_name (string): Name of the file
+            mmap (bool): If True, memory-map the intensity coefficients
+               rather than reading them via HDF5. Ignored if the file
+               does not store them contiguously and uncompressed.
 
         Returns:
             pymsg.SpecGrid: Constructed object.
@@ -60,7 +63,7 @@ class SpecGrid:
             IOError: If the file contains invalid data.
         """
 
-        self._specgrid = pyc._load_specgrid(file_name)
+        self._specgrid = pyc._load_specgrid(file_name, mmap)
 
         self._rank = pyc._get_specgrid_rank(self._specgrid)
 
@@ -153,12 +156,94 @@ class SpecGrid:
         pyc._set_specgrid_cache_limit(self._specgrid, cache_limit)
 
 
+    @property
+    def kernel_cache_usage(self):
+        """int: Current memory usage of interpolation kernel cache
+        (MB)."""
+        return pyc._get_specgrid_kernel_cache_usage(self._specgrid)
+
+
+    @property
+    def kernel_cache_limit(self):
+        """int: Maximum memory usage of interpolation kernel cache
+        (MB)."""
+        return pyc._get_specgrid_kernel_cache_limit(self._specgrid)
+    @kernel_cache_limit.setter
+    def kernel_cache_limit(self, kernel_cache_limit):
+        pyc._set_specgrid_kernel_cache_limit(self._specgrid, kernel_cache_limit)
+
+
     def flush_cache(self):
-        """Flush the grid cache"""
+        """Flush the grid and interpolation kernel caches"""
         pyc._flush_specgrid_cache(self._specgrid)
 
 
-    def intensity(self, x, mu, z, lam, deriv=None, order=3):
+    def cache_stats(self):
+        """Get statistics for the grid cache, accumulated since the
+        grid was loaded or since the last call to
+        :py:meth:`reset_cache_stats`.
+
+        Returns:
+            dict: Cache statistics, with keys 'hits' (number of
+            fetches satisfied from the cache), 'misses' (number of
+            fetches requiring data to be read), 'evictions' (number of
+            entries evicted to respect the cache limit),
+            'bytes_loaded' (in-memory size of the data loaded into the
+            cache, which can differ from the amount read from disk),
+            'fetch_time' (time spent reading data, in seconds),
+            'subset_time' (time spent subsetting data to the cache
+            wavelength range, in seconds), and 'peak_usage' (peak
+            memory usage, in MB).
+        """
+        return pyc._get_specgrid_cache_stats(self._specgrid)
+
+
+    def kernel_cache_stats(self):
+        """Get statistics for the interpolation kernel cache,
+        accumulated since the grid was loaded or since the last call
+        to :py:meth:`reset_cache_stats`.
+
+        Returns:
+            dict: Cache statistics, with keys 'hits' (number of
+            interpolations whose kernel was found in the cache),
+            'misses' (number of interpolations requiring the kernel to
+            be evaluated), 'evictions' (number of kernels evicted to
+            respect the cache limit), and 'peak_usage' (peak memory
+            usage, in MB).
+        """
+        return pyc._get_specgrid_kernel_cache_stats(self._specgrid)
+
+
+    def reset_cache_stats(self):
+        """Reset the grid and interpolation kernel cache statistics"""
+        pyc._reset_specgrid_cache_stats(self._specgrid)
+
+
+    def prefetch(self, x_min, x_max):
+        r"""Load all grid vertices within a region of parameter space
+        into the grid cache, stopping once the cache limit is
+        reached. Loading is performed in parallel when MSG is built
+        with OpenMP support.
+
+        Args:
+            x_min (dict): Lower bounds of the region; keys must match
+                axis_labels property, values must be float.
+            x_max (dict): Upper bounds of the region; keys must match
+                axis_labels property, values must be float.
+
+        Raises:
+            ValueError: If `x_min` or `x_max` do not define exactly
+                the keys appearing in the axis_labels property.
+
+        """
+
+        x_min_vec = _dict_to_x_vec(x_min, self._axis_labels)
+        x_max_vec = _dict_to_x_vec(x_max, self._axis_labels)
+
+        pyc._prefetch_specgrid(self._specgrid, x_min_vec, x_max_vec)
+
+
+    def intensity(self, x, mu, z, lam, deriv=None, order=3, out=None):
         r"""Interpolate the spectroscopic specific intensity for a
         photospheric element.
 
@@ -176,6 +261,9 @@ class SpecGrid:
                 be boolean.
             order (int, optional): Interpolation order; valid values are
                 1 or 3.
+            out (numpy.ndarray, optional): Preallocated, C-contiguous
+                float64 array to receive the result; length len(lam)-1.
+                If supplied, it is filled in place and returned.
 
         Returns:
             numpy.ndarray: Spectroscopic specific intensity
@@ -195,10 +283,10 @@ class SpecGrid:
 
         return pyc._interp_specgrid_intensity(self._specgrid, x_vec, mu,
                                               z, lam,
-                                              deriv_vec, order)
+                                              deriv_vec, order, out)
 
 
-    def E_moment(self, x, k, z, lam, deriv=None, order=3):
+    def E_moment(self, x, k, z, lam, deriv=None, order=3, out=None):
         r"""Interpolate the spectroscopic intensity E-moment for a
         photospheric element.
 
@@ -215,6 +303,9 @@ class SpecGrid:
                 be boolean.
             order (int, optional): Interpolation order; valid values are
                 1 or 3.
+            out (numpy.ndarray, optional): Preallocated, C-contiguous
+                float64 array to receive the result; length len(lam)-1.
+                If supplied, it is filled in place and returned.
 
         Returns:
             numpy.ndarray: Spectroscopic intensity E-moment
@@ -233,10 +324,10 @@ class SpecGrid:
         deriv_vec = _dict_to_deriv_vec(deriv, self._axis_labels)
 
         return pyc._interp_specgrid_E_moment(self._specgrid, x_vec, k, z,
-                                             lam, deriv_vec, order)
+                                             lam, deriv_vec, order, out)
 
 
-    def P_moment(self, x, l, z, lam, deriv=None, order=3):
+    def P_moment(self, x, l, z, lam, deriv=None, order=3, out=None):
         r"""Interpolate the spectroscopic intensity P-moment for a
         photospheric element.
 
@@ -253,6 +344,9 @@ class SpecGrid:
                 be boolean.
             order (int, optional): Interpolation order; valid values are
                 1 or 3.
+            out (numpy.ndarray, optional): Preallocated, C-contiguous
+                float64 array to receive the result; length len(lam)-1.
+                If supplied, it is filled in place and returned.
 
         Returns:
             numpy.ndarray: Spectroscopic intensity P-moment
@@ -272,10 +366,10 @@ class SpecGrid:
 
         return pyc._interp_specgrid_P_moment(self._specgrid, x_vec, l,
                                              z, lam,
-                                             deriv_vec, order)
+                                             deriv_vec, order, out)
 
 
-    def irradiance(self, x, mu, dOmega, z, lam, deriv=None, order=3):
+    def irradiance(self, x, mu, dOmega, z, lam, deriv=None, order=3, out=None):
         r"""Interpolate the spectroscopic irradiance for an object composed
         of multiple photospheric elements.
 
@@ -294,6 +388,9 @@ class SpecGrid:
                 be boolean.
             order (int, optional): Interpolation order; valid values are
                 1 or 3.
+            out (numpy.ndarray, optional): Preallocated, C-contiguous
+                float64 array to receive the result; length len(lam)-1.
+                If supplied, it is filled in place and returned.
 
         Returns:
             numpy.ndarray: Spectroscopic irradiance (erg/cm^2/s/Å) in
@@ -313,10 +410,10 @@ class SpecGrid:
 
         return pyc._interp_specgrid_irradiance(self._specgrid, x_vec, mu, dOmega,
                                                z, lam,
-                                               deriv_vec, order)
+                                               deriv_vec, order, out)
 
 
-    def flux(self, x, z, lam, deriv=None, order=3):
+    def flux(self, x, z, lam, deriv=None, order=3, out=None):
         r"""Interpolate the spectroscopic flux for a photospheric
         element.
 
@@ -332,6 +429,9 @@ class SpecGrid:
                 be boolean.
             order (int, optional): Interpolation order; valid values are
                 1 or 3.
+            out (numpy.ndarray, optional): Preallocated, C-contiguous
+                float64 array to receive the result; length len(lam)-1.
+                If supplied, it is filled in place and returned.
 
         Returns:
             numpy.ndarray: Spectroscopic flux (erg/cm^2/s/Å) in bins
@@ -351,7 +451,232 @@ class SpecGrid:
 
         return pyc._interp_specgrid_flux(self._specgrid, x_vec,
                                          z, lam,
-                                         deriv_vec, order)
+                                         deriv_vec, order, out)
+
+
+    def intensity_batch(self, x, mu, z, lam, deriv=None, order=3, out=None):
+        r"""Interpolate the spectroscopic specific intensity for a batch of
+        photospheric elements.
+
+        Args:
+            x (dict): Photospheric parameters; keys must match
+                axis_labels property, values must be numpy.ndarrays of
+                equal length.
+            mu (float or numpy.ndarray): Cosines of angles of emergence
+                relative to element normals; scalar or length len(x[]).
+            z (float or numpy.ndarray): Redshifts of elements relative
+                to observer's frame; scalar or length len(x[]).
+            lam (numpy.ndarray): Wavelength abscissa (Å) in observer's
+                frame, shared by all elements.
+            deriv (dict, optional): Flags indicating whether to evaluate
+                derivative with respect to each photospheric parameter;
+                keys must match the axis_labels property, values must
+                be boolean.
+            order (int, optional): Interpolation order; valid values are
+                1 or 3.
+            out (numpy.ndarray, optional): Preallocated, C-contiguous
+                float64 array to receive the result; shape
+                (len(x[]), len(lam)-1). If supplied, it is filled in
+                place and returned.
+
+        Returns:
+            numpy.ndarray: Spectroscopic specific intensities
+            (erg/cm^2/s/Å/sr) in bins delineated by lam; shape
+            (len(x[]), len(lam)-1).
+
+        Raises:
+            KeyError: If `x` does not define all keys appearing in the
+                axis_labels property.
+            ValueError: If `x`, `mu`, or any part of the wavelength
+                abscissa falls outside the bounds of the grid; or if
+                the values of x have mismatched length.
+            LookupError: If `x` falls in a grid void.
+
+        """
+
+        x_vec = _array_dict_to_x_vec(x, self._axis_labels)
+        deriv_vec = _dict_to_deriv_vec(deriv, self._axis_labels)
+
+        mu = _broadcast_to_vec(mu, x_vec.shape[0])
+        z = _broadcast_to_vec(z, x_vec.shape[0])
+
+        return pyc._interp_specgrid_intensity_batch(self._specgrid, x_vec, mu,
+                                                    z, lam,
+                                                    deriv_vec, order, out)
+
+
+    def E_moment_batch(self, x, k, z, lam, deriv=None, order=3, out=None):
+        r"""Interpolate the spectroscopic intensity E-moment for a batch of
+        photospheric elements.
+
+        Args:
+            x (dict): Photospheric parameters; keys must match
+                axis_labels property, values must be numpy.ndarrays of
+                equal length.
+            k (int): Degree of moment.
+            z (float or numpy.ndarray): Redshifts of elements relative
+                to observer's frame; scalar or length len(x[]).
+            lam (numpy.ndarray): Wavelength abscissa (Å) in observer's
+                frame, shared by all elements.
+            deriv (dict, optional): Flags indicating whether to evaluate
+                derivative with respect to each photospheric parameter;
+                keys must match the axis_labels property, values must
+                be boolean.
+            order (int, optional): Interpolation order; valid values are
+                1 or 3.
+            out (numpy.ndarray, optional): Preallocated, C-contiguous
+                float64 array to receive the result; shape
+                (len(x[]), len(lam)-1). If supplied, it is filled in
+                place and returned.
+
+        Returns:
+            numpy.ndarray: Spectroscopic intensity E-moments
+            (erg/cm^2/s/Å) in bins delineated by lam; shape
+            (len(x[]), len(lam)-1).
+
+        Raises:
+            KeyError: If `x` does not define all keys appearing in the
+                axis_labels property.
+            ValueError: If `x`, `k`, or any part of the wavelength
+                abscissa falls outside the bounds of the grid; or if
+                the values of x have mismatched length.
+            LookupError: If `x` falls in a grid void.
+
+        """
+
+        x_vec = _array_dict_to_x_vec(x, self._axis_labels)
+        deriv_vec = _dict_to_deriv_vec(deriv, self._axis_labels)
+
+        z = _broadcast_to_vec(z, x_vec.shape[0])
+
+        return pyc._interp_specgrid_E_moment_batch(self._specgrid, x_vec, k,
+                                                   z, lam,
+                                                   deriv_vec, order, out)
+
+
+    def P_moment_batch(self, x, l, z, lam, deriv=None, order=3, out=None):
+        r"""Interpolate the spectroscopic intensity P-moment for a batch of
+        photospheric elements.
+
+        Args:
+            x (dict): Photospheric parameters; keys must match
+                axis_labels property, values must be numpy.ndarrays of
+                equal length.
+            l (int): Harmonic degree of moment.
+            z (float or numpy.ndarray): Redshifts of elements relative
+                to observer's frame; scalar or length len(x[]).
+            lam (numpy.ndarray): Wavelength abscissa (Å) in observer's
+                frame, shared by all elements.
+            deriv (dict, optional): Flags indicating whether to evaluate
+                derivative with respect to each photospheric parameter;
+                keys must match the axis_labels property, values must
+                be boolean.
+            order (int, optional): Interpolation order; valid values are
+                1 or 3.
+            out (numpy.ndarray, optional): Preallocated, C-contiguous
+                float64 array to receive the result; shape
+                (len(x[]), len(lam)-1). If supplied, it is filled in
+                place and returned.
+
+        Returns:
+            numpy.ndarray: Spectroscopic intensity P-moments
+            (erg/cm^2/s/Å) in bins delineated by lam; shape
+            (len(x[]), len(lam)-1).
+
+        Raises:
+            KeyError: If `x` does not define all keys appearing in the
+                axis_labels property.
+            ValueError: If `x`, `l`, or any part of the wavelength
+                abscissa falls outside the bounds of the grid; or if
+                the values of x have mismatched length.
+            LookupError: If `x` falls in a grid void.
+
+        """
+
+        x_vec = _array_dict_to_x_vec(x, self._axis_labels)
+        deriv_vec = _dict_to_deriv_vec(deriv, self._axis_labels)
+
+        z = _broadcast_to_vec(z, x_vec.shape[0])
+
+        return pyc._interp_specgrid_P_moment_batch(self._specgrid, x_vec, l,
+                                                   z, lam,
+                                                   deriv_vec, order, out)
+
+
+    def flux_batch(self, x, z, lam, deriv=None, order=3, out=None):
+        r"""Interpolate the spectroscopic flux for a batch of
+        photospheric elements.
+
+        The interpolation loop runs inside the library (in parallel,
+        when OpenMP is enabled), so this method is much faster than
+        calling :meth:`flux` once per element.
+
+        Args:
+            x (dict): Photospheric parameters; keys must match
+                axis_labels property, values must be numpy.ndarrays of
+                equal length.
+            z (float or numpy.ndarray): Redshifts of elements relative
+                to observer's frame; scalar or length len(x[]).
+            lam (numpy.ndarray): Wavelength abscissa (Å) in observer's
+                frame, shared by all elements.
+            deriv (dict, optional): Flags indicating whether to evaluate
+                derivative with respect to each photospheric parameter;
+                keys must match the axis_labels property, values must
+                be boolean.
+            order (int, optional): Interpolation order; valid values are
+                1 or 3.
+            out (numpy.ndarray, optional): Preallocated, C-contiguous
+                float64 array to receive the result; shape
+                (len(x[]), len(lam)-1). If supplied, it is filled in
+                place and returned.
+
+        Returns:
+            numpy.ndarray: Spectroscopic fluxes (erg/cm^2/s/Å) in bins
+            delineated by lam; shape (len(x[]), len(lam)-1).
+
+        Raises:
+            KeyError: If `x` does not define all keys appearing in the
+                axis_labels property.
+            ValueError: If `x` or any part of the wavelength
+                abscissa falls outside the bounds of the grid; or if
+                the values of x have mismatched length.
+            LookupError: If `x` falls in a grid void.
+
+        """
+
+        x_vec = _array_dict_to_x_vec(x, self._axis_labels)
+        deriv_vec = _dict_to_deriv_vec(deriv, self._axis_labels)
+
+        z = _broadcast_to_vec(z, x_vec.shape[0])
+
+        return pyc._interp_specgrid_flux_batch(self._specgrid, x_vec,
+                                               z, lam,
+                                               deriv_vec, order, out)
+
+
+    def query(self, deriv=None, order=3):
+        r"""Create a precompiled query on the grid, for use in loops
+        that repeatedly interpolate with the same settings.
+
+        Args:
+            deriv (dict, optional): Flags indicating whether to evaluate
+                derivative with respect to each photospheric parameter;
+                keys must match the axis_labels property, values must
+                be boolean.
+            order (int, optional): Interpolation order; valid values are
+                1 or 3.
+
+        Returns:
+            pymsg.SpecGridQuery: Query object, whose methods take
+            photospheric parameters as positional arrays.
+
+        Raises:
+            ValueError: If `deriv` contains an invalid key, or `order`
+                is invalid.
+
+        """
+
+        return SpecGridQuery(self, deriv, order)
 
 
     def adjust_x(self, x, dx):
@@ -476,11 +801,92 @@ class PhotGrid:
         pyc._set_photgrid_cache_limit(self._photgrid, limit)
 
 
+    @property
+    def kernel_cache_usage(self):
+        """int: Current memory usage of interpolation kernel cache
+        (MB)."""
+        return pyc._get_photgrid_kernel_cache_usage(self._photgrid)
+
+
+    @property
+    def kernel_cache_limit(self):
+        """int: Maximum memory usage of interpolation kernel cache
+        (MB)."""
+        return pyc._get_photgrid_kernel_cache_limit(self._photgrid)
+    @kernel_cache_limit.setter
+    def kernel_cache_limit(self, kernel_cache_limit):
+        pyc._set_photgrid_kernel_cache_limit(self._photgrid, kernel_cache_limit)
+
+
     def flush_cache(self):
-        """Flush the grid cache"""
+        """Flush the grid and interpolation kernel caches"""
         pyc._flush_photgrid_cache(self._photgrid)
 
 
+    def cache_stats(self):
+        """Get statistics for the grid cache, accumulated since the
+        grid was loaded or since the last call to
+        :py:meth:`reset_cache_stats`.
+
+        Returns:
+            dict: Cache statistics, with keys 'hits' (number of
+            fetches satisfied from the cache), 'misses' (number of
+            fetches requiring data to be read), 'evictions' (number of
+            entries evicted to respect the cache limit),
+            'bytes_loaded' (in-memory size of the data loaded into the
+            cache, which can differ from the amount read from disk),
+            'fetch_time' (time spent reading data, in seconds),
+            'subset_time' (always zero, since photometric grids are
+            not subset), and 'peak_usage' (peak memory usage, in MB).
+        """
+        return pyc._get_photgrid_cache_stats(self._photgrid)
+
+
+    def kernel_cache_stats(self):
+        """Get statistics for the interpolation kernel cache,
+        accumulated since the grid was loaded or since the last call
+        to :py:meth:`reset_cache_stats`.
+
+        Returns:
+            dict: Cache statistics, with keys 'hits' (number of
+            interpolations whose kernel was found in the cache),
+            'misses' (number of interpolations requiring the kernel to
+            be evaluated), 'evictions' (number of kernels evicted to
+            respect the cache limit), and 'peak_usage' (peak memory
+            usage, in MB).
+        """
+        return pyc._get_photgrid_kernel_cache_stats(self._photgrid)
+
+
+    def reset_cache_stats(self):
+        """Reset the grid and interpolation kernel cache statistics"""
+        pyc._reset_photgrid_cache_stats(self._photgrid)
+
+
+    def prefetch(self, x_min, x_max):
+        r"""Load all grid vertices within a region of parameter space
+        into the grid cache, stopping once the cache limit is
+        reached. Loading is performed in parallel when MSG is built
+        with OpenMP support.
+
+        Args:
+            x_min (dict): Lower bounds of the region; keys must match
+                axis_labels property, values must be float.
+            x_max (dict): Upper bounds of the region; keys must match
+                axis_labels property, values must be float.
+
+        Raises:
+            ValueError: If `x_min` or `x_max` do not define exactly
+                the keys appearing in the axis_labels property.
+
+        """
+
+        x_min_vec = _dict_to_x_vec(x_min, self._axis_labels)
+        x_max_vec = _dict_to_x_vec(x_max, self._axis_labels)
+
+        pyc._prefetch_photgrid(self._photgrid, x_min_vec, x_max_vec)
+
+
     def intensity(self, x, mu, deriv=None, order=3):
         r"""Interpolate the photometric specific intensity for a
         photospheric element, normalized by the zero-point flux.
@@ -651,56 +1057,766 @@ class PhotGrid:
         return pyc._interp_photgrid_flux(self._photgrid, x_vec, deriv_vec, order)
 
 
-    def adjust_x(self, x, dx):
-        r"""Adjust photospheric parameters in a specified direction, until
-        they fall within the valid part of the grid.
+    def intensity_batch(self, x, mu, deriv=None, order=3, out=None):
+        r"""Interpolate the photometric specific intensity for a batch of
+        photospheric elements, normalized by the zero-point flux.
 
         Args:
             x (dict): Photospheric parameters; keys must match
-                axis_labels property, values must be float.
-            dx (dict): Photospheric parameter adjustment direction; keys
-                must match axis_labels property, values must be float.
-                The overall scaling is unimportant, but at least one value
-                must be non-zero.
+                axis_labels property, values must be numpy.ndarrays of
+                equal length.
+            mu (float or numpy.ndarray): Cosines of angles of emergence
+                relative to element normals; scalar or length len(x[]).
+            deriv (dict, optional): Flags indicating whether to evaluate
+                derivative with respect to each photospheric parameter;
+                keys must match the axis_labels property, values must
+                be boolean.
+            order (int, optional): Interpolation order; valid values are
+                1 or 3.
+            out (numpy.ndarray, optional): Preallocated, C-contiguous
+                float64 array to receive the result; length len(x[]).
+                If supplied, it is filled in place and returned.
 
         Returns:
-            numpy.ndarray: Adjusted photospheric parameters.
+            numpy.ndarray: Photometric specific intensities (/sr); length
+            len(x[]).
 
         Raises:
             KeyError: If `x` does not define all keys appearing in the
                 axis_labels property.
-            ValueError: If no valid `x` can be found, or if `dx` is invalid;
-                        or if x and dx have mismatched length.
+            ValueError: If `x` or `mu` fall outside the bounds of the grid;
+                or if mu or the values of x have mismatched length.
+            LookupError: If `x` falls in a grid void.
+
         """
 
-        x_vec = _dict_to_x_vec(x, self._axis_labels)
-        dx_vec = _dict_to_x_vec(dx, self._axis_labels)
+        x_vec = _array_dict_to_x_vec(x, self._axis_labels)
+        deriv_vec = _dict_to_deriv_vec(deriv, self._axis_labels)
 
-        x_adj = pyc._adjust_photgrid_x_vec(self._photgrid, x_vec, dx_vec)
+        mu = _broadcast_to_vec(mu, x_vec.shape[0])
 
-        return _x_vec_to_dict(x_adj, self._axis_labels)
+        return pyc._interp_photgrid_intensity_batch(self._photgrid, x_vec, mu, deriv_vec, order, out)
 
 
-def _dict_to_x_vec(x, axis_labels):
+    def E_moment_batch(self, x, k, deriv=None, order=3, out=None):
+        r"""Interpolate the photometric intensity E-moment for a batch of
+        photospheric elements, normalized to the zero-point flux.
 
-    for label in axis_labels:
-        if not label in x:
-            raise ValueError(f'No value provided for axis "{label}"')
+        Args:
+            x (dict): Photospheric parameters; keys must match
+                axis_labels property, values must be numpy.ndarrays of
+                equal length.
+            k (int): Degree of moment.
+            deriv (dict, optional): Flags indicating whether to evaluate
+                derivative with respect to each photospheric parameter;
+                keys must match the axis_labels property, values must
+                be boolean.
+            order (int, optional): Interpolation order; valid values are
+                1 or 3.
+            out (numpy.ndarray, optional): Preallocated, C-contiguous
+                float64 array to receive the result; length len(x[]).
+                If supplied, it is filled in place and returned.
 
-    for label in x.keys():
-        if not label in axis_labels:
-            raise ValueError(f'Invalid axis "{label}"')
+        Returns:
+            numpy.ndarray: Photometric intensity E-moments
+            (dimensionless); length len(x[]).
 
-    x_vec = np.array([x[key] for key in axis_labels])
+        Raises:
+            KeyError: If `x` does not define all keys appearing in the
+                axis_labels property.
+            ValueError: If `x` or `k` falls outside the bounds of the
+                grid; or if the values of x have mismatched length.
+            LookupError: If `x` falls in a grid void.
 
-    return x_vec
+        """
 
+        x_vec = _array_dict_to_x_vec(x, self._axis_labels)
+        deriv_vec = _dict_to_deriv_vec(deriv, self._axis_labels)
 
-def _array_dict_to_x_vec(x, axis_labels):
+        return pyc._interp_photgrid_E_moment_batch(self._photgrid, x_vec, k, deriv_vec, order, out)
 
-    for label in axis_labels:
-        if not label in x:
-            raise ValueError(f'No value provided for axis "{label}"')
+
+    def P_moment_batch(self, x, l, deriv=None, order=3, out=None):
+        r"""Interpolate the photometric intensity P-moment for a batch of
+        photospheric elements, normalized to the zero-point flux.
+
+        Args:
+            x (dict): Photospheric parameters; keys must match
+                axis_labels property, values must be numpy.ndarrays of
+                equal length.
+            l (int): Harmonic degree of moment.
+            deriv (dict, optional): Flags indicating whether to evaluate
+                derivative with respect to each photospheric parameter;
+                keys must match the axis_labels property, values must
+                be boolean.
+            order (int, optional): Interpolation order; valid values are
+                1 or 3.
+            out (numpy.ndarray, optional): Preallocated, C-contiguous
+                float64 array to receive the result; length len(x[]).
+                If supplied, it is filled in place and returned.
+
+        Returns:
+            numpy.ndarray: Photometric intensity P-moments
+            (dimensionless); length len(x[]).
+
+        Raises:
+            KeyError: If `x` does not define all keys appearing in the
+                axis_labels property.
+            ValueError: If `x` or `l` falls outside the bounds of the
+                grid; or if the values of x have mismatched length.
+            LookupError: If `x` falls in a grid void.
+
+        """
+
+        x_vec = _array_dict_to_x_vec(x, self._axis_labels)
+        deriv_vec = _dict_to_deriv_vec(deriv, self._axis_labels)
+
+        return pyc._interp_photgrid_P_moment_batch(self._photgrid, x_vec, l, deriv_vec, order, out)
+
+
+    def flux_batch(self, x, deriv=None, order=3, out=None):
+        r"""Interpolate the photometric flux for a batch of photospheric
+        elements, normalized by the zero-point flux.
+
+        The interpolation loop runs inside the library (in parallel,
+        when OpenMP is enabled), so this method is much faster than
+        calling :meth:`flux` once per element.
+
+        Args:
+            x (dict): Photospheric parameters; keys must match
+                axis_labels property, values must be numpy.ndarrays of
+                equal length.
+            deriv (dict, optional): Flags indicating whether to evaluate
+                derivative with respect to each photospheric parameter;
+                keys must match the axis_labels property, values must
+                be boolean.
+            order (int, optional): Interpolation order; valid values are
+                1 or 3.
+            out (numpy.ndarray, optional): Preallocated, C-contiguous
+                float64 array to receive the result; length len(x[]).
+                If supplied, it is filled in place and returned.
+
+        Returns:
+            numpy.ndarray: Photometric fluxes (dimensionless); length
+            len(x[]).
+
+        Raises:
+            KeyError: If `x` does not define all keys appearing in the
+                axis_labels property.
+            ValueError: If `x` falls outside the bounds of the grid; or
+                if the values of x have mismatched length.
+            LookupError: If `x` falls in a grid void.
+
+        """
+
+        x_vec = _array_dict_to_x_vec(x, self._axis_labels)
+        deriv_vec = _dict_to_deriv_vec(deriv, self._axis_labels)
+
+        return pyc._interp_photgrid_flux_batch(self._photgrid, x_vec, deriv_vec, order, out)
+
+
+    def query(self, deriv=None, order=3):
+        r"""Create a precompiled query on the grid, for use in loops
+        that repeatedly interpolate with the same settings.
+
+        Args:
+            deriv (dict, optional): Flags indicating whether to evaluate
+                derivative with respect to each photospheric parameter;
+                keys must match the axis_labels property, values must
+                be boolean.
+            order (int, optional): Interpolation order; valid values are
+                1 or 3.
+
+        Returns:
+            pymsg.PhotGridQuery: Query object, whose methods take
+            photospheric parameters as positional arrays.
+
+        Raises:
+            ValueError: If `deriv` contains an invalid key, or `order`
+                is invalid.
+
+        """
+
+        return PhotGridQuery(self, deriv, order)
+
+
+    def adjust_x(self, x, dx):
+        r"""Adjust photospheric parameters in a specified direction, until
+        they fall within the valid part of the grid.
+
+        Args:
+            x (dict): Photospheric parameters; keys must match
+                axis_labels property, values must be float.
+            dx (dict): Photospheric parameter adjustment direction; keys
+                must match axis_labels property, values must be float.
+                The overall scaling is unimportant, but at least one value
+                must be non-zero.
+
+        Returns:
+            numpy.ndarray: Adjusted photospheric parameters.
+
+        Raises:
+            KeyError: If `x` does not define all keys appearing in the
+                axis_labels property.
+            ValueError: If no valid `x` can be found, or if `dx` is invalid;
+                        or if x and dx have mismatched length.
+        """
+
+        x_vec = _dict_to_x_vec(x, self._axis_labels)
+        dx_vec = _dict_to_x_vec(dx, self._axis_labels)
+
+        x_adj = pyc._adjust_photgrid_x_vec(self._photgrid, x_vec, dx_vec)
+
+        return _x_vec_to_dict(x_adj, self._axis_labels)
+
+
+class SpecGridQuery:
+    r"""The SpecGridQuery class represents a precompiled query on a
+    SpecGrid.
+
+    The query holds a validated set of derivative flags and an
+    interpolation order. Its methods take photospheric parameters as
+    positional numpy.ndarrays (in the order given by the axis_labels
+    property) rather than dicts, and so avoid re-validating the same
+    arguments on every call. Instances are created by
+    :py:meth:`SpecGrid.query`.
+
+    """
+
+    def __init__(self, specgrid, deriv=None, order=3):
+        """SpecGridQuery constructor.
+
+        Args:
+            specgrid (pymsg.SpecGrid): Grid to query.
+            deriv (dict, optional): Flags indicating whether to evaluate
+                derivative with respect to each photospheric parameter;
+                keys must match the axis_labels property, values must
+                be boolean.
+            order (int, optional): Interpolation order; valid values are
+                1 or 3.
+
+        Returns:
+            pymsg.SpecGridQuery: Constructed object.
+
+        Raises:
+            ValueError: If `deriv` contains an invalid key, or `order`
+                is invalid.
+        """
+
+        if order not in (1, 3):
+            raise ValueError(f'Invalid order {order}')
+
+        self._grid = specgrid
+        self._specgrid = specgrid._specgrid
+        self._rank = specgrid._rank
+        self._axis_labels = list(specgrid._axis_labels)
+
+        self._deriv_vec = _dict_to_deriv_vec(deriv, self._axis_labels)
+        self._order = order
+
+
+    @property
+    def axis_labels(self):
+        """list: Axis labels, in the order expected for x_vec."""
+        return self._axis_labels
+
+
+    @property
+    def order(self):
+        """int: Interpolation order."""
+        return self._order
+
+
+    def intensity(self, x_vec, mu, z, lam, out=None):
+        r"""Interpolate the spectroscopic specific intensity.
+
+        Apart from the photospheric parameters, the arguments and
+        return value are as for :py:meth:`SpecGrid.intensity`.
+
+        Args:
+            x_vec (numpy.ndarray): Photospheric parameters, in the
+                order given by the axis_labels property; float64,
+                length rank.
+
+        """
+
+        x_vec = np.ascontiguousarray(x_vec, dtype=np.double)
+
+        if len(x_vec) != self._rank:
+            raise ValueError('x_vec has incorrect length')
+
+        return pyc._interp_specgrid_intensity(self._specgrid, x_vec, mu, z, lam,
+                                              self._deriv_vec, self._order, out)
+
+
+    def E_moment(self, x_vec, k, z, lam, out=None):
+        r"""Interpolate the spectroscopic intensity E-moment.
+
+        Apart from the photospheric parameters, the arguments and
+        return value are as for :py:meth:`SpecGrid.E_moment`.
+
+        Args:
+            x_vec (numpy.ndarray): Photospheric parameters, in the
+                order given by the axis_labels property; float64,
+                length rank.
+
+        """
+
+        x_vec = np.ascontiguousarray(x_vec, dtype=np.double)
+
+        if len(x_vec) != self._rank:
+            raise ValueError('x_vec has incorrect length')
+
+        return pyc._interp_specgrid_E_moment(self._specgrid, x_vec, k, z, lam,
+                                             self._deriv_vec, self._order, out)
+
+
+    def P_moment(self, x_vec, l, z, lam, out=None):
+        r"""Interpolate the spectroscopic intensity P-moment.
+
+        Apart from the photospheric parameters, the arguments and
+        return value are as for :py:meth:`SpecGrid.P_moment`.
+
+        Args:
+            x_vec (numpy.ndarray): Photospheric parameters, in the
+                order given by the axis_labels property; float64,
+                length rank.
+
+        """
+
+        x_vec = np.ascontiguousarray(x_vec, dtype=np.double)
+
+        if len(x_vec) != self._rank:
+            raise ValueError('x_vec has incorrect length')
+
+        return pyc._interp_specgrid_P_moment(self._specgrid, x_vec, l, z, lam,
+                                             self._deriv_vec, self._order, out)
+
+
+    def irradiance(self, x_vec, mu, dOmega, z, lam, out=None):
+        r"""Interpolate the spectroscopic irradiance.
+
+        Apart from the photospheric parameters, the arguments and
+        return value are as for :py:meth:`SpecGrid.irradiance`.
+
+        Args:
+            x_vec (numpy.ndarray): Photospheric parameters, in the
+                order given by the axis_labels property; float64,
+                shape (len(mu), rank).
+
+        """
+
+        x_vec = np.ascontiguousarray(x_vec, dtype=np.double)
+
+        if x_vec.shape[1] != self._rank:
+            raise ValueError('x_vec has incorrect shape')
+
+        return pyc._interp_specgrid_irradiance(self._specgrid, x_vec, mu, dOmega, z, lam,
+                                               self._deriv_vec, self._order, out)
+
+
+    def flux(self, x_vec, z, lam, out=None):
+        r"""Interpolate the spectroscopic flux.
+
+        Apart from the photospheric parameters, the arguments and
+        return value are as for :py:meth:`SpecGrid.flux`.
+
+        Args:
+            x_vec (numpy.ndarray): Photospheric parameters, in the
+                order given by the axis_labels property; float64,
+                length rank.
+
+        """
+
+        x_vec = np.ascontiguousarray(x_vec, dtype=np.double)
+
+        if len(x_vec) != self._rank:
+            raise ValueError('x_vec has incorrect length')
+
+        return pyc._interp_specgrid_flux(self._specgrid, x_vec, z, lam,
+                                         self._deriv_vec, self._order, out)
+
+
+    def intensity_batch(self, x_vec, mu, z, lam, out=None):
+        r"""Interpolate the spectroscopic specific intensity for a batch
+        of elements.
+
+        Apart from the photospheric parameters, the arguments and
+        return value are as for :py:meth:`SpecGrid.intensity_batch`.
+
+        Args:
+            x_vec (numpy.ndarray): Photospheric parameters, in the
+                order given by the axis_labels property; float64,
+                shape (N, rank).
+
+        """
+
+        x_vec = np.ascontiguousarray(x_vec, dtype=np.double)
+
+        if x_vec.shape[1] != self._rank:
+            raise ValueError('x_vec has incorrect shape')
+
+        mu = _broadcast_to_vec(mu, x_vec.shape[0])
+        z = _broadcast_to_vec(z, x_vec.shape[0])
+
+        return pyc._interp_specgrid_intensity_batch(self._specgrid, x_vec, mu, z, lam,
+                                                    self._deriv_vec, self._order, out)
+
+
+    def E_moment_batch(self, x_vec, k, z, lam, out=None):
+        r"""Interpolate the spectroscopic intensity E-moment for a batch
+        of elements.
+
+        Apart from the photospheric parameters, the arguments and
+        return value are as for :py:meth:`SpecGrid.E_moment_batch`.
+
+        Args:
+            x_vec (numpy.ndarray): Photospheric parameters, in the
+                order given by the axis_labels property; float64,
+                shape (N, rank).
+
+        """
+
+        x_vec = np.ascontiguousarray(x_vec, dtype=np.double)
+
+        if x_vec.shape[1] != self._rank:
+            raise ValueError('x_vec has incorrect shape')
+
+        z = _broadcast_to_vec(z, x_vec.shape[0])
+
+        return pyc._interp_specgrid_E_moment_batch(self._specgrid, x_vec, k, z, lam,
+                                                   self._deriv_vec, self._order, out)
+
+
+    def P_moment_batch(self, x_vec, l, z, lam, out=None):
+        r"""Interpolate the spectroscopic intensity P-moment for a batch
+        of elements.
+
+        Apart from the photospheric parameters, the arguments and
+        return value are as for :py:meth:`SpecGrid.P_moment_batch`.
+
+        Args:
+            x_vec (numpy.ndarray): Photospheric parameters, in the
+                order given by the axis_labels property; float64,
+                shape (N, rank).
+
+        """
+
+        x_vec = np.ascontiguousarray(x_vec, dtype=np.double)
+
+        if x_vec.shape[1] != self._rank:
+            raise ValueError('x_vec has incorrect shape')
+
+        z = _broadcast_to_vec(z, x_vec.shape[0])
+
+        return pyc._interp_specgrid_P_moment_batch(self._specgrid, x_vec, l, z, lam,
+                                                   self._deriv_vec, self._order, out)
+
+
+    def flux_batch(self, x_vec, z, lam, out=None):
+        r"""Interpolate the spectroscopic flux for a batch of elements.
+
+        Apart from the photospheric parameters, the arguments and
+        return value are as for :py:meth:`SpecGrid.flux_batch`.
+
+        Args:
+            x_vec (numpy.ndarray): Photospheric parameters, in the
+                order given by the axis_labels property; float64,
+                shape (N, rank).
+
+        """
+
+        x_vec = np.ascontiguousarray(x_vec, dtype=np.double)
+
+        if x_vec.shape[1] != self._rank:
+            raise ValueError('x_vec has incorrect shape')
+
+        z = _broadcast_to_vec(z, x_vec.shape[0])
+
+        return pyc._interp_specgrid_flux_batch(self._specgrid, x_vec, z, lam,
+                                               self._deriv_vec, self._order, out)
+
+
+class PhotGridQuery:
+    r"""The PhotGridQuery class represents a precompiled query on a
+    PhotGrid.
+
+    The query holds a validated set of derivative flags and an
+    interpolation order. Its methods take photospheric parameters as
+    positional numpy.ndarrays (in the order given by the axis_labels
+    property) rather than dicts, and so avoid re-validating the same
+    arguments on every call. Instances are created by
+    :py:meth:`PhotGrid.query`.
+
+    """
+
+    def __init__(self, photgrid, deriv=None, order=3):
+        """PhotGridQuery constructor.
+
+        Args:
+            photgrid (pymsg.PhotGrid): Grid to query.
+            deriv (dict, optional): Flags indicating whether to evaluate
+                derivative with respect to each photospheric parameter;
+                keys must match the axis_labels property, values must
+                be boolean.
+            order (int, optional): Interpolation order; valid values are
+                1 or 3.
+
+        Returns:
+            pymsg.PhotGridQuery: Constructed object.
+
+        Raises:
+            ValueError: If `deriv` contains an invalid key, or `order`
+                is invalid.
+        """
+
+        if order not in (1, 3):
+            raise ValueError(f'Invalid order {order}')
+
+        self._grid = photgrid
+        self._photgrid = photgrid._photgrid
+        self._rank = photgrid._rank
+        self._axis_labels = list(photgrid._axis_labels)
+
+        self._deriv_vec = _dict_to_deriv_vec(deriv, self._axis_labels)
+        self._order = order
+
+
+    @property
+    def axis_labels(self):
+        """list: Axis labels, in the order expected for x_vec."""
+        return self._axis_labels
+
+
+    @property
+    def order(self):
+        """int: Interpolation order."""
+        return self._order
+
+
+    def intensity(self, x_vec, mu):
+        r"""Interpolate the photometric specific intensity.
+
+        Apart from the photospheric parameters, the arguments and
+        return value are as for :py:meth:`PhotGrid.intensity`.
+
+        Args:
+            x_vec (numpy.ndarray): Photospheric parameters, in the
+                order given by the axis_labels property; float64,
+                length rank.
+
+        """
+
+        x_vec = np.ascontiguousarray(x_vec, dtype=np.double)
+
+        if len(x_vec) != self._rank:
+            raise ValueError('x_vec has incorrect length')
+
+        return pyc._interp_photgrid_intensity(self._photgrid, x_vec, mu,
+                                              self._deriv_vec, self._order)
+
+
+    def E_moment(self, x_vec, k):
+        r"""Interpolate the photometric intensity E-moment.
+
+        Apart from the photospheric parameters, the arguments and
+        return value are as for :py:meth:`PhotGrid.E_moment`.
+
+        Args:
+            x_vec (numpy.ndarray): Photospheric parameters, in the
+                order given by the axis_labels property; float64,
+                length rank.
+
+        """
+
+        x_vec = np.ascontiguousarray(x_vec, dtype=np.double)
+
+        if len(x_vec) != self._rank:
+            raise ValueError('x_vec has incorrect length')
+
+        return pyc._interp_photgrid_E_moment(self._photgrid, x_vec, k,
+                                             self._deriv_vec, self._order)
+
+
+    def P_moment(self, x_vec, l):
+        r"""Interpolate the photometric intensity P-moment.
+
+        Apart from the photospheric parameters, the arguments and
+        return value are as for :py:meth:`PhotGrid.P_moment`.
+
+        Args:
+            x_vec (numpy.ndarray): Photospheric parameters, in the
+                order given by the axis_labels property; float64,
+                length rank.
+
+        """
+
+        x_vec = np.ascontiguousarray(x_vec, dtype=np.double)
+
+        if len(x_vec) != self._rank:
+            raise ValueError('x_vec has incorrect length')
+
+        return pyc._interp_photgrid_P_moment(self._photgrid, x_vec, l,
+                                             self._deriv_vec, self._order)
+
+
+    def irradiance(self, x_vec, mu, dOmega):
+        r"""Interpolate the photometric irradiance.
+
+        Apart from the photospheric parameters, the arguments and
+        return value are as for :py:meth:`PhotGrid.irradiance`.
+
+        Args:
+            x_vec (numpy.ndarray): Photospheric parameters, in the
+                order given by the axis_labels property; float64,
+                shape (len(mu), rank).
+
+        """
+
+        x_vec = np.ascontiguousarray(x_vec, dtype=np.double)
+
+        if x_vec.shape[1] != self._rank:
+            raise ValueError('x_vec has incorrect shape')
+
+        return pyc._interp_photgrid_irradiance(self._photgrid, x_vec, mu, dOmega,
+                                               self._deriv_vec, self._order)
+
+
+    def flux(self, x_vec):
+        r"""Interpolate the photometric flux.
+
+        Apart from the photospheric parameters, the arguments and
+        return value are as for :py:meth:`PhotGrid.flux`.
+
+        Args:
+            x_vec (numpy.ndarray): Photospheric parameters, in the
+                order given by the axis_labels property; float64,
+                length rank.
+
+        """
+
+        x_vec = np.ascontiguousarray(x_vec, dtype=np.double)
+
+        if len(x_vec) != self._rank:
+            raise ValueError('x_vec has incorrect length')
+
+        return pyc._interp_photgrid_flux(self._photgrid, x_vec,
+                                         self._deriv_vec, self._order)
+
+
+    def intensity_batch(self, x_vec, mu, out=None):
+        r"""Interpolate the photometric specific intensity for a batch
+        of elements.
+
+        Apart from the photospheric parameters, the arguments and
+        return value are as for :py:meth:`PhotGrid.intensity_batch`.
+
+        Args:
+            x_vec (numpy.ndarray): Photospheric parameters, in the
+                order given by the axis_labels property; float64,
+                shape (N, rank).
+
+        """
+
+        x_vec = np.ascontiguousarray(x_vec, dtype=np.double)
+
+        if x_vec.shape[1] != self._rank:
+            raise ValueError('x_vec has incorrect shape')
+
+        mu = _broadcast_to_vec(mu, x_vec.shape[0])
+
+        return pyc._interp_photgrid_intensity_batch(self._photgrid, x_vec, mu,
+                                                    self._deriv_vec, self._order, out)
+
+
+    def E_moment_batch(self, x_vec, k, out=None):
+        r"""Interpolate the photometric intensity E-moment for a batch
+        of elements.
+
+        Apart from the photospheric parameters, the arguments and
+        return value are as for :py:meth:`PhotGrid.E_moment_batch`.
+
+        Args:
+            x_vec (numpy.ndarray): Photospheric parameters, in the
+                order given by the axis_labels property; float64,
+                shape (N, rank).
+
+        """
+
+        x_vec = np.ascontiguousarray(x_vec, dtype=np.double)
+
+        if x_vec.shape[1] != self._rank:
+            raise ValueError('x_vec has incorrect shape')
+
+        return pyc._interp_photgrid_E_moment_batch(self._photgrid, x_vec, k,
+                                                   self._deriv_vec, self._order, out)
+
+
+    def P_moment_batch(self, x_vec, l, out=None):
+        r"""Interpolate the photometric intensity P-moment for a batch
+        of elements.
+
+        Apart from the photospheric parameters, the arguments and
+        return value are as for :py:meth:`PhotGrid.P_moment_batch`.
+
+        Args:
+            x_vec (numpy.ndarray): Photospheric parameters, in the
+                order given by the axis_labels property; float64,
+                shape (N, rank).
+
+        """
+
+        x_vec = np.ascontiguousarray(x_vec, dtype=np.double)
+
+        if x_vec.shape[1] != self._rank:
+            raise ValueError('x_vec has incorrect shape')
+
+        return pyc._interp_photgrid_P_moment_batch(self._photgrid, x_vec, l,
+                                                   self._deriv_vec, self._order, out)
+
+
+    def flux_batch(self, x_vec, out=None):
+        r"""Interpolate the photometric flux for a batch of elements.
+
+        Apart from the photospheric parameters, the arguments and
+        return value are as for :py:meth:`PhotGrid.flux_batch`.
+
+        Args:
+            x_vec (numpy.ndarray): Photospheric parameters, in the
+                order given by the axis_labels property; float64,
+                shape (N, rank).
+
+        """
+
+        x_vec = np.ascontiguousarray(x_vec, dtype=np.double)
+
+        if x_vec.shape[1] != self._rank:
+            raise ValueError('x_vec has incorrect shape')
+
+        return pyc._interp_photgrid_flux_batch(self._photgrid, x_vec,
+                                               self._deriv_vec, self._order, out)
+
+
+def _dict_to_x_vec(x, axis_labels):
+
+    for label in axis_labels:
+        if not label in x:
+            raise ValueError(f'No value provided for axis "{label}"')
+
+    for label in x.keys():
+        if not label in axis_labels:
+            raise ValueError(f'Invalid axis "{label}"')
+
+    x_vec = np.array([x[key] for key in axis_labels])
+
+    return x_vec
+
+
+def _array_dict_to_x_vec(x, axis_labels):
+
+    for label in axis_labels:
+        if not label in x:
+            raise ValueError(f'No value provided for axis "{label}"')
 
     for label in x.keys():
         if not label in axis_labels:
@@ -718,6 +1834,13 @@ def _array_dict_to_x_vec(x, axis_labels):
     return x_vec
 
 
+def _broadcast_to_vec(a, m):
+
+    vec = np.ascontiguousarray(np.broadcast_to(a, m), dtype=np.double)
+
+    return vec
+
+
 def _dict_to_deriv_vec(deriv, axis_labels):
 
     if deriv is not None:
@@ -25,7 +25,7 @@ from libcpp cimport bool
 
 # C definitions
 
-cdef extern from "cmsg.h":
+cdef extern from "cmsg.h" nogil:
 
     # shared
 
@@ -53,6 +53,7 @@ cdef extern from "cmsg.h":
     # specgrid
 
     void load_specgrid(const char *specgrid_filename, void **specgrid, Stat *stat)
+    void load_specgrid_mmap(const char *specgrid_filename, void **specgrid, Stat *stat)
     void unload_specgrid(void *specgrid)
 
     void get_specgrid_rank(void *specgrid, int *rank)
@@ -60,6 +61,8 @@ cdef extern from "cmsg.h":
     void get_specgrid_lam_max(void *specgrid, double *lam_max)
     void get_specgrid_cache_usage(void *specgrid, int *cache_usage)
     void get_specgrid_cache_limit(void *specgrid, int *cache_limit)
+    void get_specgrid_kernel_cache_limit(void *specgrid, int *kernel_cache_limit)
+    void get_specgrid_kernel_cache_usage(void *specgrid, int *kernel_cache_usage)
     void get_specgrid_cache_lam_min(void *specgrid, double *cache_lam_min)
     void get_specgrid_cache_lam_max(void *specgrid, double *cache_lam_max)
     void get_specgrid_axis_x_min(void *specgrid, int i, double *axis_x_min)
@@ -67,10 +70,17 @@ cdef extern from "cmsg.h":
     void get_specgrid_axis_label(void *specgrid, int i, char *axis_label)
 
     void set_specgrid_cache_limit(void *specgrid, int cache_limit, Stat *stat)
+    void set_specgrid_kernel_cache_limit(void *specgrid, int kernel_cache_limit, Stat *stat)
     void set_specgrid_cache_lam_min(void *specgrid, double cache_lam_min, Stat *stat)
     void set_specgrid_cache_lam_max(void *specgrid, double cache_lam_max, Stat *stat)
 
     void flush_specgrid_cache(void *specgrid)
+    void get_specgrid_cache_stats(void *specgrid, long long *n_hits, long long *n_misses, long long *n_evictions,
+                                  long long *n_bytes_loaded, double *fetch_time, double *subset_time, int *peak_usage)
+    void get_specgrid_kernel_cache_stats(void *specgrid, long long *n_hits, long long *n_misses, long long *n_evictions,
+                                         int *peak_usage)
+    void reset_specgrid_cache_stats(void *specgrid)
+    void prefetch_specgrid(void *specgrid, int r, double x_min[], double x_max[], Stat *stat)
 
     void interp_specgrid_intensity(void *specgrid, int n, int r, double x_vec[], double mu,
                                    double z, double lam[], double I[],
@@ -88,6 +98,19 @@ cdef extern from "cmsg.h":
                               double z, double lam[], double F[],
                               Stat *stat, bool deriv_vec[], int *order)
     
+    void interp_specgrid_intensity_batch(void *specgrid, int n, int m, int r, double x_vec[],
+                                         double mu[], double z[], double lam[], double I[],
+                                         Stat *stat, bool deriv_vec[], int *order)
+    void interp_specgrid_E_moment_batch(void *specgrid, int n, int m, int r, double x_vec[],
+                                        int k, double z[], double lam[], double E[],
+                                        Stat *stat, bool deriv_vec[], int *order)
+    void interp_specgrid_P_moment_batch(void *specgrid, int n, int m, int r, double x_vec[],
+                                        int l, double z[], double lam[], double P[],
+                                        Stat *stat, bool deriv_vec[], int *order)
+    void interp_specgrid_flux_batch(void *specgrid, int n, int m, int r, double x_vec[],
+                                    double z[], double lam[], double F[],
+                                    Stat *stat, bool deriv_vec[], int *order)
+
     void adjust_specgrid_x_vec(void *specgrid, int r, double x_vec[], double dx_vec[],
                                double x_adj[], Stat *stat)
 
@@ -101,13 +124,22 @@ cdef extern from "cmsg.h":
     void get_photgrid_rank(void *photgrid, int *rank)
     void get_photgrid_cache_usage(void *photgrid, int *cache_usage)
     void get_photgrid_cache_limit(void *photgrid, int *cache_limit)
+    void get_photgrid_kernel_cache_limit(void *photgrid, int *kernel_cache_limit)
+    void get_photgrid_kernel_cache_usage(void *photgrid, int *kernel_cache_usage)
     void get_photgrid_axis_x_min(void *photgrid, int i, double *axis_x_min)
     void get_photgrid_axis_x_max(void *photgrid, int i, double *axis_x_max)
     void get_photgrid_axis_label(void *photgrid, int i, char *axis_label)
 
     void set_photgrid_cache_limit(void *photgrid, int cache_limit, Stat *stat)
+    void set_photgrid_kernel_cache_limit(void *photgrid, int kernel_cache_limit, Stat *stat)
 
     void flush_photgrid_cache(void *photgrid)
+    void get_photgrid_cache_stats(void *photgrid, long long *n_hits, long long *n_misses, long long *n_evictions,
+                                  long long *n_bytes_loaded, double *fetch_time, double *subset_time, int *peak_usage)
+    void get_photgrid_kernel_cache_stats(void *photgrid, long long *n_hits, long long *n_misses, long long *n_evictions,
+                                         int *peak_usage)
+    void reset_photgrid_cache_stats(void *photgrid)
+    void prefetch_photgrid(void *photgrid, int r, double x_min[], double x_max[], Stat *stat)
 
     void interp_photgrid_intensity(void *photgrid, int r, double x_vec[], double mu,
                                    double *I,
@@ -125,5 +157,18 @@ cdef extern from "cmsg.h":
                               double *F,
                               Stat *stat, bool deriv_vec[], int *order)
 
+    void interp_photgrid_intensity_batch(void *photgrid, int m, int r, double x_vec[], double mu[],
+                                         double I[],
+                                         Stat *stat, bool deriv_vec[], int *order)
+    void interp_photgrid_E_moment_batch(void *photgrid, int m, int r, double x_vec[], int k,
+                                        double E[],
+                                        Stat *stat, bool deriv_vec[], int *order)
+    void interp_photgrid_P_moment_batch(void *photgrid, int m, int r, double x_vec[], int l,
+                                        double P[],
+                                        Stat *stat, bool deriv_vec[], int *order)
+    void interp_photgrid_flux_batch(void *photgrid, int m, int r, double x_vec[],
+                                    double F[],
+                                    Stat *stat, bool deriv_vec[], int *order)
+
     void adjust_photgrid_x_vec(void *photgrid, int r, double x_vec[], double dx_vec[],
                                double x_adj[], Stat *stat)
@@ -25,12 +25,15 @@ from libcpp cimport bool
 
 # specgrid
 
-def _load_specgrid(str specgrid_filename):
+def _load_specgrid(str specgrid_filename, bint mmap=False):
 
     cdef void *specgrid
     cdef Stat stat
 
-    load_specgrid(specgrid_filename.encode('ascii'), &specgrid, &stat)
+    if mmap:
+        load_specgrid_mmap(specgrid_filename.encode('ascii'), &specgrid, &stat)
+    else:
+        load_specgrid(specgrid_filename.encode('ascii'), &specgrid, &stat)
     _handle_error(stat)
 
     return <uintptr_t>specgrid
@@ -86,6 +89,24 @@ def _get_specgrid_cache_limit(uintptr_t specgrid):
     return cache_limit
 
 
+def _get_specgrid_kernel_cache_limit(uintptr_t specgrid):
+
+    cdef int kernel_cache_limit
+
+    get_specgrid_kernel_cache_limit(<void *>specgrid, &kernel_cache_limit)
+
+    return kernel_cache_limit
+
+
+def _get_specgrid_kernel_cache_usage(uintptr_t specgrid):
+
+    cdef int kernel_cache_usage
+
+    get_specgrid_kernel_cache_usage(<void *>specgrid, &kernel_cache_usage)
+
+    return kernel_cache_usage
+
+
 def _get_specgrid_cache_lam_min(uintptr_t specgrid):
 
     cdef double cache_lam_min
@@ -138,6 +159,14 @@ def _set_specgrid_cache_limit(uintptr_t specgrid, int cache_limit):
     set_specgrid_cache_limit(<void *>specgrid, cache_limit, &stat)
     _handle_error(stat)
 
+
+def _set_specgrid_kernel_cache_limit(uintptr_t specgrid, int kernel_cache_limit):
+
+    cdef Stat stat
+
+    set_specgrid_kernel_cache_limit(<void *>specgrid, kernel_cache_limit, &stat)
+    _handle_error(stat)
+
     
 def _set_specgrid_cache_lam_min(uintptr_t specgrid, double cache_lam_min):
 
@@ -160,102 +189,323 @@ def _flush_specgrid_cache(uintptr_t specgrid):
     flush_specgrid_cache(<void *>specgrid)
 
 
+def _get_specgrid_cache_stats(uintptr_t specgrid):
+
+    cdef long long n_hits
+    cdef long long n_misses
+    cdef long long n_evictions
+    cdef long long n_bytes_loaded
+    cdef double fetch_time
+    cdef double subset_time
+    cdef int peak_usage
+
+    get_specgrid_cache_stats(<void *>specgrid, &n_hits, &n_misses, &n_evictions,
+                             &n_bytes_loaded, &fetch_time, &subset_time, &peak_usage)
+
+    return {'hits': n_hits,
+            'misses': n_misses,
+            'evictions': n_evictions,
+            'bytes_loaded': n_bytes_loaded,
+            'fetch_time': fetch_time,
+            'subset_time': subset_time,
+            'peak_usage': peak_usage}
+
+
+def _get_specgrid_kernel_cache_stats(uintptr_t specgrid):
+
+    cdef long long n_hits
+    cdef long long n_misses
+    cdef long long n_evictions
+    cdef int peak_usage
+
+    get_specgrid_kernel_cache_stats(<void *>specgrid, &n_hits, &n_misses, &n_evictions, &peak_usage)
+
+    return {'hits': n_hits,
+            'misses': n_misses,
+            'evictions': n_evictions,
+            'peak_usage': peak_usage}
+
+
+def _reset_specgrid_cache_stats(uintptr_t specgrid):
+
+    reset_specgrid_cache_stats(<void *>specgrid)
+
+
+def _prefetch_specgrid(uintptr_t specgrid, double[:] x_min, double[:] x_max):
+
+    cdef Stat stat
+    cdef int r
+
+    r = len(x_min)
+
+    if len(x_max) != r:
+        raise ValueError('x_min and x_max have different lengths')
+
+    with nogil:
+        prefetch_specgrid(<void *>specgrid, r, &x_min[0], &x_max[0], &stat)
+    _handle_error(stat)
+
+
 def _interp_specgrid_intensity(uintptr_t specgrid, double[:] x_vec, double mu, double z, double[:] lam,
-                               bool[:] deriv_vec, int order):
+                               bool[:] deriv_vec, int order, out=None):
 
-    cdef double[:] I
+    cdef double[::1] I
     cdef Stat stat
+    cdef int n
+    cdef int r
 
     n = len(lam)
     r = len(x_vec)
 
-    I = np.empty(n-1, dtype=np.double)
+    if out is None:
+        out = np.empty(n-1, dtype=np.double)
+
+    I = out
+
+    if I.shape[0] != n-1:
+        raise ValueError('out array has incorrect shape')
 
-    interp_specgrid_intensity(<void *>specgrid, n, r, &x_vec[0], mu, z, &lam[0], &I[0], &stat, &deriv_vec[0], &order)
+    with nogil:
+        interp_specgrid_intensity(<void *>specgrid, n, r, &x_vec[0], mu, z, &lam[0], &I[0], &stat, &deriv_vec[0], &order)
     _handle_error(stat)
 
-    return np.asarray(I)
+    return out
 
 
 def _interp_specgrid_E_moment(uintptr_t specgrid, double[:] x_vec, int k, double z, double[:] lam,
-                              bool[:] deriv_vec, int order):
+                              bool[:] deriv_vec, int order, out=None):
 
-    cdef double[:] E
+    cdef double[::1] E
     cdef Stat stat
+    cdef int n
+    cdef int r
 
     n = len(lam)
     r = len(x_vec)
 
-    E = np.empty(n-1, dtype=np.double)
+    if out is None:
+        out = np.empty(n-1, dtype=np.double)
 
-    interp_specgrid_E_moment(<void *>specgrid, n, r, &x_vec[0], k, z, &lam[0], &E[0], &stat, &deriv_vec[0], &order)
+    E = out
+
+    if E.shape[0] != n-1:
+        raise ValueError('out array has incorrect shape')
+
+    with nogil:
+        interp_specgrid_E_moment(<void *>specgrid, n, r, &x_vec[0], k, z, &lam[0], &E[0], &stat, &deriv_vec[0], &order)
     _handle_error(stat)
 
-    return np.asarray(E)
+    return out
 
 
 def _interp_specgrid_P_moment(uintptr_t specgrid, double[:] x_vec, int l, double z, double[:] lam,
-                              bool[:] deriv_vec, int order):
+                              bool[:] deriv_vec, int order, out=None):
 
-    cdef double[:] P
+    cdef double[::1] P
     cdef Stat stat
+    cdef int n
+    cdef int r
 
     n = len(lam)
     r = len(x_vec)
 
-    P = np.empty(n-1, dtype=np.double)
+    if out is None:
+        out = np.empty(n-1, dtype=np.double)
+
+    P = out
 
-    interp_specgrid_P_moment(<void *>specgrid, n, r, &x_vec[0], l, z, &lam[0], &P[0], &stat, &deriv_vec[0], &order)
+    if P.shape[0] != n-1:
+        raise ValueError('out array has incorrect shape')
+
+    with nogil:
+        interp_specgrid_P_moment(<void *>specgrid, n, r, &x_vec[0], l, z, &lam[0], &P[0], &stat, &deriv_vec[0], &order)
     _handle_error(stat)
 
-    return np.asarray(P)
+    return out
 
 
 def _interp_specgrid_irradiance(uintptr_t specgrid, double[:,::1] x_vec, double[:] mu, double[:] dOmega,
-                                double[:] z, double[:] lam, bool[:] deriv_vec, int order):
+                                double[:] z, double[:] lam, bool[:] deriv_vec, int order, out=None):
 
-    cdef double[:] F
+    cdef double[::1] F
     cdef Stat stat
+    cdef int n
+    cdef int m
+    cdef int r
 
     n = len(lam)
     m = x_vec.shape[0]
     r = x_vec.shape[1]
 
-    F = np.empty(n-1, dtype=np.double)
+    if out is None:
+        out = np.empty(n-1, dtype=np.double)
+
+    F = out
+
+    if F.shape[0] != n-1:
+        raise ValueError('out array has incorrect shape')
 
-    interp_specgrid_irradiance(<void *>specgrid, n, m, r, &x_vec[0,0], &mu[0], &dOmega[0],
-                               &z[0], &lam[0], &F[0], &stat, &deriv_vec[0], &order)
+    with nogil:
+        interp_specgrid_irradiance(<void *>specgrid, n, m, r, &x_vec[0,0], &mu[0], &dOmega[0],
+                                   &z[0], &lam[0], &F[0], &stat, &deriv_vec[0], &order)
     _handle_error(stat)
 
-    return np.asarray(F)
+    return out
 
 
-def _interp_specgrid_flux(uintptr_t specgrid, double[:] x_vec, double z, double[:] lam, bool[:] deriv_vec, int order):
+def _interp_specgrid_flux(uintptr_t specgrid, double[:] x_vec, double z, double[:] lam, bool[:] deriv_vec, int order, out=None):
 
-    cdef double[:] F
+    cdef double[::1] F
     cdef Stat stat
+    cdef int n
+    cdef int r
 
     n = len(lam)
     r = len(x_vec)
 
-    F = np.empty(n-1, dtype=np.double)
+    if out is None:
+        out = np.empty(n-1, dtype=np.double)
+
+    F = out
+
+    if F.shape[0] != n-1:
+        raise ValueError('out array has incorrect shape')
 
-    interp_specgrid_flux(<void *>specgrid, n, r, &x_vec[0], z, &lam[0], &F[0], &stat, &deriv_vec[0], &order)
+    with nogil:
+        interp_specgrid_flux(<void *>specgrid, n, r, &x_vec[0], z, &lam[0], &F[0], &stat, &deriv_vec[0], &order)
     _handle_error(stat)
 
-    return np.asarray(F)
+    return out
+
+
+def _interp_specgrid_intensity_batch(uintptr_t specgrid, double[:,::1] x_vec, double[:] mu, double[:] z, double[:] lam,
+                                     bool[:] deriv_vec, int order, out=None):
+
+    cdef double[:,::1] I
+    cdef Stat stat
+    cdef int n
+    cdef int m
+    cdef int r
+
+    n = len(lam)
+    m = x_vec.shape[0]
+    r = x_vec.shape[1]
+
+    if out is None:
+        out = np.empty((m, n-1), dtype=np.double)
+
+    I = out
+
+    if I.shape[0] != m or I.shape[1] != n-1:
+        raise ValueError('out array has incorrect shape')
+
+    with nogil:
+        interp_specgrid_intensity_batch(<void *>specgrid, n, m, r, &x_vec[0,0], &mu[0], &z[0], &lam[0],
+                                         &I[0,0], &stat, &deriv_vec[0], &order)
+    _handle_error(stat)
+
+    return out
+
+
+def _interp_specgrid_E_moment_batch(uintptr_t specgrid, double[:,::1] x_vec, int k, double[:] z, double[:] lam,
+                                    bool[:] deriv_vec, int order, out=None):
+
+    cdef double[:,::1] E
+    cdef Stat stat
+    cdef int n
+    cdef int m
+    cdef int r
+
+    n = len(lam)
+    m = x_vec.shape[0]
+    r = x_vec.shape[1]
+
+    if out is None:
+        out = np.empty((m, n-1), dtype=np.double)
+
+    E = out
+
+    if E.shape[0] != m or E.shape[1] != n-1:
+        raise ValueError('out array has incorrect shape')
+
+    with nogil:
+        interp_specgrid_E_moment_batch(<void *>specgrid, n, m, r, &x_vec[0,0], k, &z[0], &lam[0],
+                                    &E[0,0], &stat, &deriv_vec[0], &order)
+    _handle_error(stat)
+
+    return out
+
+
+def _interp_specgrid_P_moment_batch(uintptr_t specgrid, double[:,::1] x_vec, int l, double[:] z, double[:] lam,
+                                    bool[:] deriv_vec, int order, out=None):
+
+    cdef double[:,::1] P
+    cdef Stat stat
+    cdef int n
+    cdef int m
+    cdef int r
+
+    n = len(lam)
+    m = x_vec.shape[0]
+    r = x_vec.shape[1]
+
+    if out is None:
+        out = np.empty((m, n-1), dtype=np.double)
+
+    P = out
+
+    if P.shape[0] != m or P.shape[1] != n-1:
+        raise ValueError('out array has incorrect shape')
+
+    with nogil:
+        interp_specgrid_P_moment_batch(<void *>specgrid, n, m, r, &x_vec[0,0], l, &z[0], &lam[0],
+                                    &P[0,0], &stat, &deriv_vec[0], &order)
+    _handle_error(stat)
+
+    return out
+
+
+def _interp_specgrid_flux_batch(uintptr_t specgrid, double[:,::1] x_vec, double[:] z, double[:] lam,
+                                bool[:] deriv_vec, int order, out=None):
+
+    cdef double[:,::1] F
+    cdef Stat stat
+    cdef int n
+    cdef int m
+    cdef int r
+
+    n = len(lam)
+    m = x_vec.shape[0]
+    r = x_vec.shape[1]
+
+    if out is None:
+        out = np.empty((m, n-1), dtype=np.double)
+
+    F = out
+
+    if F.shape[0] != m or F.shape[1] != n-1:
+        raise ValueError('out array has incorrect shape')
+
+    with nogil:
+        interp_specgrid_flux_batch(<void *>specgrid, n, m, r, &x_vec[0,0], &z[0], &lam[0],
+                                    &F[0,0], &stat, &deriv_vec[0], &order)
+    _handle_error(stat)
+
+    return out
 
 
 def _adjust_specgrid_x_vec(uintptr_t specgrid, double[:] x_vec, double[:] dx_vec):
 
     cdef double[:] x_adj
     cdef Stat stat
+    cdef int r
 
     r = len(x_vec)
 
     x_adj = np.empty(r, dtype=np.double)
 
-    adjust_specgrid_x_vec(<void *>specgrid, r, &x_vec[0], &dx_vec[0], &x_adj[0], &stat)
+    with nogil:
+        adjust_specgrid_x_vec(<void *>specgrid, r, &x_vec[0], &dx_vec[0], &x_adj[0], &stat)
     _handle_error(stat)
 
     return x_adj
@@ -317,6 +567,24 @@ def _get_photgrid_cache_limit(uintptr_t photgrid):
     return cache_limit
 
 
+def _get_photgrid_kernel_cache_limit(uintptr_t photgrid):
+
+    cdef int kernel_cache_limit
+
+    get_photgrid_kernel_cache_limit(<void *>photgrid, &kernel_cache_limit)
+
+    return kernel_cache_limit
+
+
+def _get_photgrid_kernel_cache_usage(uintptr_t photgrid):
+
+    cdef int kernel_cache_usage
+
+    get_photgrid_kernel_cache_usage(<void *>photgrid, &kernel_cache_usage)
+
+    return kernel_cache_usage
+
+
 def _get_photgrid_axis_x_min(uintptr_t photgrid, int i):
 
     cdef double x_min
@@ -351,20 +619,87 @@ def _set_photgrid_cache_limit(uintptr_t photgrid, int cache_limit):
     set_photgrid_cache_limit(<void *>photgrid, cache_limit, &stat)
     _handle_error(stat)
 
+
+def _set_photgrid_kernel_cache_limit(uintptr_t photgrid, int kernel_cache_limit):
+
+    cdef Stat stat
+
+    set_photgrid_kernel_cache_limit(<void *>photgrid, kernel_cache_limit, &stat)
+    _handle_error(stat)
+
     
 def _flush_photgrid_cache(uintptr_t photgrid):
 
     flush_photgrid_cache(<void *>photgrid)
 
 
+def _get_photgrid_cache_stats(uintptr_t photgrid):
+
+    cdef long long n_hits
+    cdef long long n_misses
+    cdef long long n_evictions
+    cdef long long n_bytes_loaded
+    cdef double fetch_time
+    cdef double subset_time
+    cdef int peak_usage
+
+    get_photgrid_cache_stats(<void *>photgrid, &n_hits, &n_misses, &n_evictions,
+                             &n_bytes_loaded, &fetch_time, &subset_time, &peak_usage)
+
+    return {'hits': n_hits,
+            'misses': n_misses,
+            'evictions': n_evictions,
+            'bytes_loaded': n_bytes_loaded,
+            'fetch_time': fetch_time,
+            'subset_time': subset_time,
+            'peak_usage': peak_usage}
+
+
+def _get_photgrid_kernel_cache_stats(uintptr_t photgrid):
+
+    cdef long long n_hits
+    cdef long long n_misses
+    cdef long long n_evictions
+    cdef int peak_usage
+
+    get_photgrid_kernel_cache_stats(<void *>photgrid, &n_hits, &n_misses, &n_evictions, &peak_usage)
+
+    return {'hits': n_hits,
+            'misses': n_misses,
+            'evictions': n_evictions,
+            'peak_usage': peak_usage}
+
+
+def _reset_photgrid_cache_stats(uintptr_t photgrid):
+
+    reset_photgrid_cache_stats(<void *>photgrid)
+
+
+def _prefetch_photgrid(uintptr_t photgrid, double[:] x_min, double[:] x_max):
+
+    cdef Stat stat
+    cdef int r
+
+    r = len(x_min)
+
+    if len(x_max) != r:
+        raise ValueError('x_min and x_max have different lengths')
+
+    with nogil:
+        prefetch_photgrid(<void *>photgrid, r, &x_min[0], &x_max[0], &stat)
+    _handle_error(stat)
+
+
 def _interp_photgrid_intensity(uintptr_t photgrid, double[:] x_vec, double mu, bool[:] deriv_vec, int order):
 
     cdef double I
     cdef Stat stat
+    cdef int r
 
     r = len(x_vec)
 
-    interp_photgrid_intensity(<void *>photgrid, r, &x_vec[0], mu, &I, &stat, &deriv_vec[0], &order)
+    with nogil:
+        interp_photgrid_intensity(<void *>photgrid, r, &x_vec[0], mu, &I, &stat, &deriv_vec[0], &order)
     _handle_error(stat)
 
     return I
@@ -374,10 +709,12 @@ def _interp_photgrid_E_moment(uintptr_t photgrid, double[:] x_vec, int k, bool[:
 
     cdef double M
     cdef Stat stat
+    cdef int r
 
     r = len(x_vec)
 
-    interp_photgrid_E_moment(<void *>photgrid, r, &x_vec[0], k, &M, &stat, &deriv_vec[0], &order)
+    with nogil:
+        interp_photgrid_E_moment(<void *>photgrid, r, &x_vec[0], k, &M, &stat, &deriv_vec[0], &order)
     _handle_error(stat)
 
     return M
@@ -387,10 +724,12 @@ def _interp_photgrid_P_moment(uintptr_t photgrid, double[:] x_vec, int l, bool[:
 
     cdef double P
     cdef Stat stat
+    cdef int r
 
     r = len(x_vec)
 
-    interp_photgrid_P_moment(<void *>photgrid, r, &x_vec[0], l, &P, &stat, &deriv_vec[0], &order)
+    with nogil:
+        interp_photgrid_P_moment(<void *>photgrid, r, &x_vec[0], l, &P, &stat, &deriv_vec[0], &order)
     _handle_error(stat)
 
     return P
@@ -401,12 +740,15 @@ def _interp_photgrid_irradiance(uintptr_t photgrid, double[:,::1] x_vec, double[
 
     cdef double F
     cdef Stat stat
+    cdef int m
+    cdef int r
 
     m = x_vec.shape[0]
     r = x_vec.shape[1]
 
-    interp_photgrid_irradiance(<void *>photgrid, m, r, &x_vec[0,0], &mu[0], &dOmega[0],
-                               &F, &stat, &deriv_vec[0], &order)
+    with nogil:
+        interp_photgrid_irradiance(<void *>photgrid, m, r, &x_vec[0,0], &mu[0], &dOmega[0],
+                                   &F, &stat, &deriv_vec[0], &order)
     _handle_error(stat)
 
     return np.asarray(F)
@@ -416,25 +758,137 @@ def _interp_photgrid_flux(uintptr_t photgrid, double[:] x_vec, bool[:] deriv_vec
 
     cdef double F
     cdef Stat stat
+    cdef int r
 
     r = len(x_vec)
 
-    interp_photgrid_flux(<void *>photgrid, r, &x_vec[0], &F, &stat, &deriv_vec[0], &order)
+    with nogil:
+        interp_photgrid_flux(<void *>photgrid, r, &x_vec[0], &F, &stat, &deriv_vec[0], &order)
     _handle_error(stat)
 
     return F
 
 
+def _interp_photgrid_intensity_batch(uintptr_t photgrid, double[:,::1] x_vec, double[:] mu,
+                                     bool[:] deriv_vec, int order, out=None):
+
+    cdef double[::1] I
+    cdef Stat stat
+    cdef int m
+    cdef int r
+
+    m = x_vec.shape[0]
+    r = x_vec.shape[1]
+
+    if out is None:
+        out = np.empty(m, dtype=np.double)
+
+    I = out
+
+    if I.shape[0] != m:
+        raise ValueError('out array has incorrect shape')
+
+    with nogil:
+        interp_photgrid_intensity_batch(<void *>photgrid, m, r, &x_vec[0,0], &mu[0],
+                                        &I[0], &stat, &deriv_vec[0], &order)
+    _handle_error(stat)
+
+    return out
+
+
+def _interp_photgrid_E_moment_batch(uintptr_t photgrid, double[:,::1] x_vec, int k,
+                                    bool[:] deriv_vec, int order, out=None):
+
+    cdef double[::1] E
+    cdef Stat stat
+    cdef int m
+    cdef int r
+
+    m = x_vec.shape[0]
+    r = x_vec.shape[1]
+
+    if out is None:
+        out = np.empty(m, dtype=np.double)
+
+    E = out
+
+    if E.shape[0] != m:
+        raise ValueError('out array has incorrect shape')
+
+    with nogil:
+        interp_photgrid_E_moment_batch(<void *>photgrid, m, r, &x_vec[0,0], k,
+                                       &E[0], &stat, &deriv_vec[0], &order)
+    _handle_error(stat)
+
+    return out
+
+
+def _interp_photgrid_P_moment_batch(uintptr_t photgrid, double[:,::1] x_vec, int l,
+                                    bool[:] deriv_vec, int order, out=None):
+
+    cdef double[::1] P
+    cdef Stat stat
+    cdef int m
+    cdef int r
+
+    m = x_vec.shape[0]
+    r = x_vec.shape[1]
+
+    if out is None:
+        out = np.empty(m, dtype=np.double)
+
+    P = out
+
+    if P.shape[0] != m:
+        raise ValueError('out array has incorrect shape')
+
+    with nogil:
+        interp_photgrid_P_moment_batch(<void *>photgrid, m, r, &x_vec[0,0], l,
+                                       &P[0], &stat, &deriv_vec[0], &order)
+    _handle_error(stat)
+
+    return out
+
+
+def _interp_photgrid_flux_batch(uintptr_t photgrid, double[:,::1] x_vec,
+                                bool[:] deriv_vec, int order, out=None):
+
+    cdef double[::1] F
+    cdef Stat stat
+    cdef int m
+    cdef int r
+
+    m = x_vec.shape[0]
+    r = x_vec.shape[1]
+
+    if out is None:
+        out = np.empty(m, dtype=np.double)
+
+    F = out
+
+    if F.shape[0] != m:
+        raise ValueError('out array has incorrect shape')
+
+    with nogil:
+        interp_photgrid_flux_batch(<void *>photgrid, m, r, &x_vec[0,0],
+                                   &F[0], &stat, &deriv_vec[0], &order)
+    _handle_error(stat)
+
+    return out
+
+
 def _adjust_photgrid_x_vec(uintptr_t photgrid, double[:] x_vec, double[:] dx_vec):
 
     cdef double[:] x_adj
     cdef Stat stat
+    cdef int r
 
     r = len(x_vec)
 
     x_adj = np.empty(r, dtype=np.double)
 
-    adjust_photgrid_x_vec(<void *>photgrid, r, &x_vec[0], &dx_vec[0], &x_adj[0], &stat)
+    with nogil:
+        adjust_photgrid_x_vec(<void *>photgrid, r, &x_vec[0], &dx_vec[0], &x_adj[0], &stat)
     _handle_error(stat)
 
     return x_adj
@@ -50,6 +50,7 @@ typedef enum {
 typedef void *SpecGrid;
 
 void load_specgrid(const char *specgrid_file_name, SpecGrid *specgrid, Stat *stat);
+void load_specgrid_mmap(const char *specgrid_file_name, SpecGrid *specgrid, Stat *stat);
 void unload_specgrid(SpecGrid specgrid);
 
 void get_specgrid_rank(SpecGrid specgrid, int *rank);
@@ -60,6 +61,8 @@ void get_specgrid_cache_lam_min(SpecGrid specgrid, double *cache_lam_min);
 void get_specgrid_cache_lam_max(SpecGrid specgrid, double *cache_lam_max);
 void get_specgrid_cache_limit(SpecGrid specgrid, int *cache_limit);
 void get_specgrid_cache_usage(SpecGrid specgrid, int *cache_usage);
+void get_specgrid_kernel_cache_limit(SpecGrid specgrid, int *kernel_cache_limit);
+void get_specgrid_kernel_cache_usage(SpecGrid specgrid, int *kernel_cache_usage);
 void get_specgrid_axis_x_min(SpecGrid specgrid, int i, double *axis_x_min);
 void get_specgrid_axis_x_max(SpecGrid specgrid, int i, double *axis_x_max);
 void get_specgrid_axis_label(SpecGrid specgrid, int i, char *axis_label);
@@ -67,8 +70,15 @@ void get_specgrid_axis_label(SpecGrid specgrid, int i, char *axis_label);
 void set_specgrid_cache_lam_min(SpecGrid specgrid, double cache_lam_min, Stat *stat);
 void set_specgrid_cache_lam_max(SpecGrid specgrid, double cache_lam_max, Stat *stat);
 void set_specgrid_cache_limit(SpecGrid specgrid, int cache_limit, Stat *stat);
+void set_specgrid_kernel_cache_limit(SpecGrid specgrid, int kernel_cache_limit, Stat *stat);
 
 void flush_specgrid_cache(SpecGrid specgrid);
+void get_specgrid_cache_stats(SpecGrid specgrid, long long *n_hits, long long *n_misses, long long *n_evictions,
+                              long long *n_bytes_loaded, double *fetch_time, double *subset_time, int *peak_usage);
+void get_specgrid_kernel_cache_stats(SpecGrid specgrid, long long *n_hits, long long *n_misses, long long *n_evictions,
+                                     int *peak_usage);
+void reset_specgrid_cache_stats(SpecGrid specgrid);
+void prefetch_specgrid(SpecGrid specgrid, int r, double x_min[], double x_max[], Stat *stat);
 
 void interp_specgrid_intensity(SpecGrid specgrid, int n, int r, double x_vec[], double mu,
 			       double z, double lam[], double I[],
@@ -86,6 +96,19 @@ void interp_specgrid_flux(SpecGrid specgrid, int n, int r,  double x_vec[],
 			  double z, double lam[], double F[],
 			  Stat *stat, bool deriv_vec[], int *order);
 
+void interp_specgrid_intensity_batch(SpecGrid specgrid, int n, int m, int r, double x_vec[],
+				     double mu[], double z[], double lam[], double I[],
+				     Stat *stat, bool deriv_vec[], int *order);
+void interp_specgrid_E_moment_batch(SpecGrid specgrid, int n, int m, int r, double x_vec[],
+				    int k, double z[], double lam[], double E[],
+				    Stat *stat, bool deriv_vec[], int *order);
+void interp_specgrid_P_moment_batch(SpecGrid specgrid, int n, int m, int r, double x_vec[],
+				    int l, double z[], double lam[], double P[],
+				    Stat *stat, bool deriv_vec[], int *order);
+void interp_specgrid_flux_batch(SpecGrid specgrid, int n, int m, int r, double x_vec[],
+				double z[], double lam[], double F[],
+				Stat *stat, bool deriv_vec[], int *order);
+
 void adjust_specgrid_x_vec(SpecGrid specgrid, int r, double x_vec[], double dx_vec[], double x_adj[], Stat *stat);
 
 // photgrid interface
@@ -100,13 +123,22 @@ void get_photgrid_rank(PhotGrid photgrid, int *rank);
 void get_photgrid_shape(PhotGrid photgrid, int shape[]);
 void get_photgrid_cache_limit(PhotGrid photgrid, int *cache_limit);
 void get_photgrid_cache_usage(PhotGrid photgrid, int *cache_usage);
+void get_photgrid_kernel_cache_limit(PhotGrid photgrid, int *kernel_cache_limit);
+void get_photgrid_kernel_cache_usage(PhotGrid photgrid, int *kernel_cache_usage);
 void get_photgrid_axis_x_min(PhotGrid photgrid, int i, double *axis_x_min);
 void get_photgrid_axis_x_max(PhotGrid photgrid, int i, double *axis_x_max);
 void get_photgrid_axis_label(PhotGrid photgrid, int i, char *axis_label);
 
 void set_photgrid_cache_limit(PhotGrid photgrid, int cache_limit, Stat *stat);
+void set_photgrid_kernel_cache_limit(PhotGrid photgrid, int kernel_cache_limit, Stat *stat);
 
 void flush_photgrid_cache(PhotGrid photgrid);
+void get_photgrid_cache_stats(PhotGrid photgrid, long long *n_hits, long long *n_misses, long long *n_evictions,
+                              long long *n_bytes_loaded, double *fetch_time, double *subset_time, int *peak_usage);
+void get_photgrid_kernel_cache_stats(PhotGrid photgrid, long long *n_hits, long long *n_misses, long long *n_evictions,
+                                     int *peak_usage);
+void reset_photgrid_cache_stats(PhotGrid photgrid);
+void prefetch_photgrid(PhotGrid photgrid, int r, double x_min[], double x_max[], Stat *stat);
 
 void interp_photgrid_intensity(PhotGrid photgrid, int r, double x_vec[], double mu,
 			       double *I,
@@ -124,6 +156,19 @@ void interp_photgrid_flux(PhotGrid photgrid, int r, double x_vec[],
 			  double *F,
 			  Stat *stat, bool deriv_vec[], int *order);
 
+void interp_photgrid_intensity_batch(PhotGrid photgrid, int m, int r, double x_vec[], double mu[],
+				     double I[],
+				     Stat *stat, bool deriv_vec[], int *order);
+void interp_photgrid_E_moment_batch(PhotGrid photgrid, int m, int r, double x_vec[], int k,
+				    double E[],
+				    Stat *stat, bool deriv_vec[], int *order);
+void interp_photgrid_P_moment_batch(PhotGrid photgrid, int m, int r, double x_vec[], int l,
+				    double P[],
+				    Stat *stat, bool deriv_vec[], int *order);
+void interp_photgrid_flux_batch(PhotGrid photgrid, int m, int r, double x_vec[],
+				double F[],
+				Stat *stat, bool deriv_vec[], int *order);
+
 void adjust_photgrid_x_vec(PhotGrid photgrid, int r, double x_vec[], double dx_vec[], double x_adj[], Stat *stat);
 
 // library routines